@@ -4,15 +4,22 @@ ASCII Photo Mask Generator
 Create stunning ASCII art where photos shine through character-shaped masks.
 """
 
+import os
+import io
 import sys
-import random
+import base64
 import argparse
+import functools
 import platform
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Union
 from dataclasses import dataclass
+from xml.sax.saxutils import escape
 
-from PIL import Image, ImageDraw, ImageFont, ImageEnhance
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont, ImageEnhance, ImageFilter, ImageStat
 
 
 class CharacterSets:
@@ -102,9 +109,9 @@ class CharacterSets:
         return descriptions.get(name, name)
 
 
-@dataclass
+@dataclass(frozen=True)
 class Config:
-    """Configuration for ASCII art generation."""
+    """Configuration for ASCII art generation (immutable and hashable)."""
 
     # Character settings
     char_set: str = "$@B%8&WM#*oahkbdpqwmZO0QLCJUYXzcvunxrjft/\\|()1{}[]?-_+~<>i!lI;:,\"^`'. "
@@ -120,24 +127,24 @@ class Config:
     # Visual enhancement
     brightness_multiplier: float = 1.8
     contrast_multiplier: float = 1.3
+    sharp_sampling: bool = False  # LANCZOS instead of BOX for the brightness grid
 
     # Character rendering
     bold_enabled: bool = True
-    bold_offset_range: List[int] = None  # Auto-set to [-1, 0, 1]
+    bold_offset_range: Tuple[int, ...] = (-1, 0, 1)  # Max |offset| = bold reach
 
     # Background
     background_color: str = "black"
 
-    def __post_init__(self):
-        """Initialize computed values."""
-        if self.bold_offset_range is None:
-            self.bold_offset_range = [-1, 0, 1]
+    # Rendering
+    tile_height: int = 512  # Max stripe height in pixels (bounds peak memory)
 
 
 class FontManager:
     """Manages font loading with fallback support across platforms."""
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_font_for_charset(charset_name: str) -> Tuple[Optional[str], dict]:
         """
         Get the optimal font for a specific character set.
@@ -208,10 +215,13 @@ class FontManager:
             ]
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def find_available_font() -> Tuple[Optional[str], dict]:
         """
         Find first available font from platform-specific candidates.
 
+        The result is cached, so the candidate paths are only checked once.
+
         Returns:
             Tuple of (font_path, font_kwargs) or (None, {}) if no font found
         """
@@ -220,6 +230,16 @@ class FontManager:
                 return path, kwargs
         return None, {}
 
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _load_truetype(
+        font_path: str,
+        size: int,
+        font_kwargs: Tuple[Tuple[str, object], ...]
+    ) -> ImageFont.FreeTypeFont:
+        """Load a single font size, cached so repeated runs reuse the FreeType face."""
+        return ImageFont.truetype(font_path, size, **dict(font_kwargs))
+
     @staticmethod
     def load_fonts(
         base_size: int,
@@ -258,7 +278,9 @@ class FontManager:
             size = int(base_size * multiplier)
 
             try:
-                fonts.append(ImageFont.truetype(font_path, size, **font_kwargs))
+                fonts.append(
+                    FontManager._load_truetype(font_path, size, tuple(sorted(font_kwargs.items())))
+                )
             except Exception:
                 continue
 
@@ -269,19 +291,33 @@ class ImageProcessor:
     """Handles image loading and preprocessing."""
 
     @staticmethod
-    def load_and_resize(image_path: Path, target_size: Tuple[int, int]) -> Image.Image:
+    def load_and_resize(
+        image: Union[Path, Image.Image],
+        target_size: Tuple[int, int],
+        resample: Image.Resampling = Image.Resampling.BILINEAR
+    ) -> Image.Image:
         """
         Load image and resize to target dimensions.
 
         Args:
-            image_path: Path to source image
+            image: Path to source image, or an already decoded image
             target_size: (width, height) tuple
+            resample: Resampling filter (BILINEAR is plenty for the backdrop
+                seen through the character mask; pass LANCZOS when needed)
 
         Returns:
             Resized RGB image
         """
-        img = Image.open(image_path).convert('RGB')
-        return img.resize(target_size, Image.Resampling.LANCZOS)
+        if isinstance(image, Image.Image):
+            img = image
+        else:
+            img = Image.open(image)
+
+            # Let libjpeg decode large JPEGs pre-scaled (no-op for other formats)
+            width, height = target_size
+            img.draft('RGB', (width * 2, height * 2))
+
+        return img.convert('RGB').resize(target_size, resample)
 
     @staticmethod
     def enhance_image(img: Image.Image, brightness: float, contrast: float) -> Image.Image:
@@ -296,15 +332,50 @@ class ImageProcessor:
         Returns:
             Enhanced image
         """
-        # Brightness
-        enhancer = ImageEnhance.Brightness(img)
-        img = enhancer.enhance(brightness)
+        if img.mode != 'RGB':
+            # Brightness
+            enhancer = ImageEnhance.Brightness(img)
+            img = enhancer.enhance(brightness)
+
+            # Contrast
+            enhancer = ImageEnhance.Contrast(img)
+            return enhancer.enhance(contrast)
+
+        # Both enhancements are per-channel affine maps, so apply them as lookup
+        # tables instead of blending against full-size degenerate images. The
+        # tables repeat Pillow's blend arithmetic (float32, truncated, clipped)
+        # so the result matches ImageEnhance exactly.
+        bright = ImageProcessor._blend_lut(0, brightness)
+
+        # Contrast pivots on the rounded mean of the brightened image's
+        # per-pixel luma, as in Pillow. Summing band histograms gives the same
+        # mean without a full-size brightened copy.
+        histogram = [0] * 256
+        for y0 in range(0, img.height, 256):
+            band = img.crop((0, y0, img.width, min(y0 + 256, img.height)))
+            band_histogram = band.point(bright * 3).convert('L').histogram()
+            histogram = [total + count for total, count in zip(histogram, band_histogram)]
+        mean = int(ImageStat.Stat(histogram).mean[0] + 0.5)
+
+        contrast_lut = ImageProcessor._blend_lut(mean, contrast)
+        return img.point([contrast_lut[value] for value in bright] * 3)
+
+    @staticmethod
+    def _blend_lut(base: int, factor: float) -> List[int]:
+        """
+        Build the 8-bit table of Image.blend(solid base, img, factor).
 
-        # Contrast
-        enhancer = ImageEnhance.Contrast(img)
-        img = enhancer.enhance(contrast)
+        Args:
+            base: Value of the solid degenerate image
+            factor: Blend factor (1.0 = identity)
 
-        return img
+        Returns:
+            256 output values indexed by input value
+        """
+        values = np.arange(256, dtype=np.float32)
+        base = np.float32(base)
+        blended = base + np.float32(factor) * (values - base)
+        return np.clip(blended.astype(np.int32), 0, 255).tolist()
 
     @staticmethod
     def get_average_brightness(img: Image.Image, x: int, y: int, width: int, height: int) -> float:
@@ -312,17 +383,47 @@ class ImageProcessor:
         Calculate average brightness of image region.
 
         Args:
-            img: Source image
+            img: Grayscale ('L') source image; other modes are converted first
             x, y: Top-left corner of region
             width, height: Region dimensions
 
         Returns:
             Average brightness (0-255)
         """
+        if width <= 0 or height <= 0:
+            return 0
+
         region = img.crop((x, y, x + width, y + height))
-        grayscale = region.convert('L')
-        pixels = list(grayscale.getdata())
-        return sum(pixels) / len(pixels) if pixels else 0
+        if region.mode != 'L':
+            region = region.convert('L')
+        return ImageStat.Stat(region).mean[0]
+
+    @staticmethod
+    def get_cell_brightness(
+        img: Image.Image,
+        cols: int,
+        rows: int,
+        resample: Image.Resampling = Image.Resampling.BOX
+    ) -> np.ndarray:
+        """
+        Calculate average brightness of every grid cell in one pass.
+
+        Downsampling straight to grid resolution lets Pillow's C resize do the
+        per-cell averaging.
+
+        Args:
+            img: Grayscale ('L') source image; other modes are converted first
+            cols, rows: Grid dimensions in cells
+            resample: Resampling filter (BOX is the plain per-cell mean; pass
+                LANCZOS for a sharper, costlier grid)
+
+        Returns:
+            (rows, cols) uint8 array of average brightness values (0-255)
+        """
+        if img.mode != 'L':
+            img = img.convert('L')
+        grid = img.resize((cols, rows), resample)
+        return np.asarray(grid)
 
 
 class ASCIIConverter:
@@ -336,6 +437,42 @@ class ASCIIConverter:
             char_set: String of characters from darkest to lightest
         """
         self.char_set = char_set
+        self.char_lut = np.array(list(char_set))
+        self._max_index = len(char_set) - 1
+
+        # Character index for every possible 8-bit brightness value
+        self.index_lut = np.array(
+            [self.brightness_to_index(value) for value in range(256)],
+            dtype=np.intp
+        )
+
+    def brightness_to_index(self, brightness: float) -> int:
+        """
+        Convert brightness value to an index into the character set.
+
+        Args:
+            brightness: Brightness value (0-255)
+
+        Returns:
+            Index of the corresponding character
+        """
+        index = int(brightness * self._max_index / 255)
+        return max(0, min(index, self._max_index))  # Clamp
+
+    def brightness_to_indices(self, brightness: np.ndarray) -> np.ndarray:
+        """
+        Convert a matrix of brightness values to character set indices.
+
+        Args:
+            brightness: Array of brightness values (0-255)
+
+        Returns:
+            Integer array of the same shape with character indices
+        """
+        brightness = np.asarray(brightness)
+        if brightness.dtype != np.uint8:
+            brightness = brightness.clip(0, 255).astype(np.uint8)
+        return self.index_lut[brightness]
 
     def brightness_to_char(self, brightness: float) -> str:
         """
@@ -347,40 +484,179 @@ class ASCIIConverter:
         Returns:
             Corresponding ASCII character
         """
-        index = int((brightness / 255) * (len(self.char_set) - 1))
-        index = max(0, min(index, len(self.char_set) - 1))  # Clamp
-        return self.char_set[index]
+        return self.char_set[self.brightness_to_index(brightness)]
+
+    def brightness_to_chars(self, brightness: np.ndarray) -> np.ndarray:
+        """
+        Convert a matrix of brightness values to ASCII characters.
+
+        Args:
+            brightness: Array of brightness values (0-255)
+
+        Returns:
+            Array of the same shape holding the corresponding characters
+        """
+        return self.char_lut[self.brightness_to_indices(brightness)]
 
 
 class ASCIIPhotoMask:
     """Main class for generating ASCII photo masks."""
 
-    def __init__(self, config: Config):
+    def __init__(
+        self,
+        config: Config,
+        glyph_cache: Optional[List[List[Optional[Tuple[np.ndarray, int, int]]]]] = None,
+        executor: Optional[Executor] = None
+    ):
         """
         Initialize generator with configuration.
 
         Args:
             config: Configuration object
+            glyph_cache: Result of an earlier _precompute_glyphs() call with
+                the same charset, font size, randomization and bold settings;
+                rasterized here when omitted
+            executor: Long-lived thread pool to render tiles on; a
+                short-lived pool per image is used when omitted
         """
         self.config = config
+        self.executor = executor
         self.converter = ASCIIConverter(config.char_set)
 
-    def generate(self, input_path: Path, output_path: Path):
+        # Get appropriate font for this character set
+        font_path, font_kwargs = FontManager.get_font_for_charset(config.charset_name)
+
+        # Load fonts
+        size_range = config.random_size_range if config.enable_randomization else (1.0, 1.0)
+        self.fonts = FontManager.load_fonts(config.font_size, size_range, font_path, font_kwargs)
+
+        # Rasterize every (font, character) pair once up front, indexed as
+        # glyph_cache[font_idx][char_idx] to match the brightness indices
+        self.glyph_cache = glyph_cache if glyph_cache is not None else self._precompute_glyphs()
+
+        # Characters with an empty glyph (e.g. space) leave the mask untouched
+        self._drawable = np.array([
+            any(glyphs[char_idx] is not None for glyphs in self.glyph_cache)
+            for char_idx in range(len(config.char_set))
+        ])
+
+        # Vertical extent of any cached glyph relative to its text origin
+        glyphs = [glyph for row in self.glyph_cache for glyph in row if glyph is not None]
+        self._glyph_vertical_reach = (
+            min((y for _, _, y in glyphs), default=0),
+            max((y + pixels.shape[0] for pixels, _, y in glyphs), default=0),
+        )
+
+    def _precompute_glyphs(self) -> List[List[Optional[Tuple[np.ndarray, int, int]]]]:
+        """
+        Rasterize every character of the charset in every loaded font.
+
+        The result is read-only and can be shared between generators whose
+        configs differ only in settings that don't affect glyphs.
+
+        Returns:
+            Glyph cache indexed as [font_idx][char_idx]; each entry is
+            (pixels, x_offset, y_offset), or None for empty glyphs
+        """
+        return [
+            [atlas[char] for char in self.config.char_set]
+            for atlas in (self._render_atlas(font, self.config.char_set) for font in self.fonts)
+        ]
+
+    def _render_atlas(
+        self,
+        font: ImageFont.FreeTypeFont,
+        char_set: str
+    ) -> Dict[str, Optional[Tuple[np.ndarray, int, int]]]:
+        """
+        Rasterize all characters of one font into a single atlas strip.
+
+        The strip is drawn with one ImageDraw and dilated with one filter pass,
+        then sliced into the per-character glyph masks used for blitting.
+
+        Args:
+            font: Font to render with
+            char_set: Characters to render
+
+        Returns:
+            Dictionary mapping each character to (glyph, offset_x, offset_y), where
+            glyph is a uint8 coverage array and the offsets position it relative
+            to the text origin, or None for empty glyphs
+        """
+        # Bold effect needs room around each glyph for the dilation
+        if self.config.bold_enabled:
+            pad = max(abs(offset) for offset in self.config.bold_offset_range)
+        else:
+            pad = 0
+
+        # Lay out non-empty glyphs left to right, each in its own padded slot
+        glyphs: Dict[str, Optional[Tuple[np.ndarray, int, int]]] = {}
+        slots = []
+        atlas_width = atlas_height = 0
+        for char in sorted(set(char_set)):
+            left, top, right, bottom = font.getbbox(char)
+            if right <= left or bottom <= top:
+                glyphs[char] = None
+                continue
+            slot_size = (right - left + 2 * pad, bottom - top + 2 * pad)
+            slots.append((char, atlas_width, left, top, slot_size))
+            atlas_width += slot_size[0]
+            atlas_height = max(atlas_height, slot_size[1])
+
+        if not slots:
+            return glyphs
+
+        atlas = Image.new('L', (atlas_width, atlas_height), 0)
+        atlas_draw = ImageDraw.Draw(atlas)
+        for char, slot_x, left, top, _ in slots:
+            atlas_draw.text((slot_x + pad - left, pad - top), char, font=font, fill=255)
+
+        # Bold effect: one max-filter dilation instead of drawing offset copies.
+        # Slots are padded, so dilation never bleeds into a neighbouring glyph.
+        if pad:
+            atlas = atlas.filter(ImageFilter.MaxFilter(2 * pad + 1))
+
+        pixels = np.asarray(atlas)
+        for char, slot_x, left, top, (slot_width, slot_height) in slots:
+            glyph = pixels[:slot_height, slot_x:slot_x + slot_width]
+            glyphs[char] = (glyph, left - pad, top - pad)
+
+        return glyphs
+
+    def generate(
+        self,
+        source: Union[Path, Image.Image],
+        output_path: Optional[Path] = None
+    ) -> Optional[Image.Image]:
         """
         Generate ASCII photo mask art.
 
+        The output format follows the file extension: '.svg' writes text
+        elements filled with the photo, '.txt' the bare character grid,
+        '.jpg'/'.jpeg' a JPEG (quality 92), and anything else a raster image.
+
         Args:
-            input_path: Path to source image
-            output_path: Path to save output image
+            source: Path to source image, or an already decoded image
+            output_path: Path to save output image; if None, nothing is
+                written and the caller encodes the returned image itself
+
+        Returns:
+            The rendered image for raster outputs, None for SVG and text
         """
-        # Load source image
-        source_img = Image.open(input_path).convert('RGB')
+        # Open source image (header only; pixels are decoded below)
+        from_file = not isinstance(source, Image.Image)
+        source_img = Image.open(source) if from_file else source
         img_width, img_height = source_img.size
 
         # Calculate grid dimensions
         cell_width = img_width / self.config.char_width
         char_height = int((img_height / cell_width))
-        cell_height = img_height / char_height
+
+        # Decode as grayscale once; it only feeds brightness sampling, so let
+        # libjpeg decode straight to 'L' near grid resolution (no-op for non-JPEG)
+        if from_file:
+            source_img.draft('L', (self.config.char_width * 2, char_height * 2))
+        gray_source = source_img.convert('L')
 
         # Calculate output dimensions
         output_width = self.config.char_width * self.config.font_size
@@ -389,16 +665,25 @@ class ASCIIPhotoMask:
         print(f"Creating ASCII art: {self.config.char_width}x{char_height} characters")
         print(f"Output size: {output_width}x{output_height} pixels")
 
-        # Get appropriate font for this character set
-        font_path, font_kwargs = FontManager.get_font_for_charset(self.config.charset_name)
+        # Select characters for the whole grid at once
+        resample = (Image.Resampling.LANCZOS if self.config.sharp_sampling
+                    else Image.Resampling.BOX)
+        brightness = ImageProcessor.get_cell_brightness(
+            gray_source, self.config.char_width, char_height, resample
+        )
+        char_indices = self.converter.brightness_to_indices(brightness)
 
-        # Load fonts
-        size_range = self.config.random_size_range if self.config.enable_randomization else (1.0, 1.0)
-        fonts = FontManager.load_fonts(self.config.font_size, size_range, font_path, font_kwargs)
+        # Plain-text output needs only the character grid
+        suffix = output_path.suffix.lower() if output_path else ''
+        if suffix == '.txt':
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._save_text(output_path, char_indices)
+            print(f"\n✓ ASCII art text saved to: {output_path}")
+            return None
 
         # Prepare base image
         img_resized = ImageProcessor.load_and_resize(
-            input_path,
+            source,
             (output_width, output_height)
         )
 
@@ -409,86 +694,254 @@ class ASCIIPhotoMask:
             self.config.contrast_multiplier
         )
 
-        # Create black background and mask
-        output_img = Image.new('RGB', (output_width, output_height), self.config.background_color)
-        mask = Image.new('L', (output_width, output_height), 0)
-        mask_draw = ImageDraw.Draw(mask)
-
-        # Generate character mask
-        for row in range(char_height):
-            for col in range(self.config.char_width):
-                self._draw_character(
-                    source_img, mask_draw, fonts,
-                    row, col, cell_width, cell_height,
-                    img_width, img_height
-                )
-
-            # Progress indicator
-            if (row + 1) % 10 == 0:
-                print(f"Progress: {row + 1}/{char_height} rows")
+        # Space cells leave the mask untouched, so skip them outright
+        visible = self._drawable[char_indices]
 
-        print("Compositing image with character masks...")
+        # Draw all random offsets and font choices in one batch
+        grid_shape = (char_height, self.config.char_width)
+        if self.config.enable_randomization:
+            offset_range = int(self.config.font_size * self.config.random_position_offset)
+            offsets = np.random.randint(-offset_range, offset_range + 1, size=grid_shape + (2,))
+            font_indices = np.random.randint(0, len(self.fonts), size=grid_shape)
+        else:
+            offsets = np.zeros(grid_shape + (2,), dtype=np.int64)
+            font_indices = np.zeros(grid_shape, dtype=np.int64)
+
+        # Flatten the visible cells into output positions
+        rows, cols = np.nonzero(visible)
+        cells = (
+            cols * self.config.font_size + offsets[rows, cols, 0],
+            rows * self.config.font_size + offsets[rows, cols, 1],
+            char_indices[rows, cols],
+            font_indices[rows, cols],
+        )
+        print(f"Placing {len(rows)} characters")
 
-        # Composite: show photo only through character mask
-        output_img = Image.composite(img_resized, output_img, mask)
+        # In-memory render; encoding is left to the caller
+        if output_path is None:
+            return self._render_image(img_resized, cells, char_height)
 
         # Save output
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_img.save(output_path)
+        result = None
+        if suffix == '.svg':
+            self._save_svg(output_path, img_resized, cells)
+        elif suffix in ('.jpg', '.jpeg'):
+            # Fast lossy encode for previews; PNG deflate dominates large canvases
+            result = self._render_image(img_resized, cells, char_height)
+            result.save(output_path, 'JPEG', quality=92, optimize=False)
+        else:
+            result = self._render_image(img_resized, cells, char_height)
+            result.save(output_path)
 
         print(f"\n✓ ASCII photo art saved to: {output_path}")
         print(f"  View with: open '{output_path}'")
+        return result
 
-    def _draw_character(
+    def _render_image(
         self,
-        source_img: Image.Image,
-        mask_draw: ImageDraw.Draw,
-        fonts: List[ImageFont.FreeTypeFont],
-        row: int,
-        col: int,
-        cell_width: float,
-        cell_height: float,
-        img_width: int,
-        img_height: int
-    ):
-        """Draw a single character on the mask."""
-        # Get cell position in source image
-        x = int(col * cell_width)
-        y = int(row * cell_height)
-
-        # Calculate brightness and select character
-        brightness = ImageProcessor.get_average_brightness(
-            source_img,
-            x, y,
-            min(int(cell_width), img_width - x),
-            min(int(cell_height), img_height - y)
-        )
-        char = self.converter.brightness_to_char(brightness)
+        backdrop: Image.Image,
+        cells: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+        grid_rows: int
+    ) -> Image.Image:
+        """
+        Rasterize the character mask and composite the photo through it.
 
-        # Calculate base position in output
-        base_x = col * self.config.font_size
-        base_y = row * self.config.font_size
+        The output is built in horizontal tiles, each with its own small mask,
+        and written back into the backdrop, so no full-size mask or second
+        full-size canvas is ever allocated.
 
-        # Apply random offset if enabled
-        if self.config.enable_randomization:
-            offset_range = int(self.config.font_size * self.config.random_position_offset)
-            random_offset_x = random.randint(-offset_range, offset_range)
-            random_offset_y = random.randint(-offset_range, offset_range)
-            paste_x = base_x + random_offset_x
-            paste_y = base_y + random_offset_y
+        Args:
+            backdrop: Enhanced photo at output size (composited in place)
+            cells: Arrays of (paste_x, paste_y, char_idx, font_idx) for visible cells
+            grid_rows: Number of character rows
+
+        Returns:
+            RGB output image
+        """
+        # Tiles span whole grid rows, at most tile_height pixels, and at least
+        # one tile per core so every core has work
+        workers = min(os.cpu_count() or 1, grid_rows)
+        rows_per_tile = max(1, min(
+            self.config.tile_height // self.config.font_size,
+            -(-grid_rows // workers)
+        ))
+        bounds = [
+            row * self.config.font_size
+            for row in list(range(0, grid_rows, rows_per_tile)) + [grid_rows]
+        ]
+
+        print("Compositing image with character masks...")
+
+        # Render tiles concurrently (NumPy and Pillow release the GIL)
+        if self.executor is not None:
+            pool_context = nullcontext(self.executor)
         else:
-            paste_x, paste_y = base_x, base_y
+            pool_context = ThreadPoolExecutor(max_workers=workers)
+        with pool_context as pool:
+            tiles = pool.map(
+                lambda band: self._render_tile(backdrop, cells, *band),
+                zip(bounds[:-1], bounds[1:])
+            )
+            for y0, tile in zip(bounds, tiles):
+                backdrop.paste(tile, (0, y0))
+
+        return backdrop
+
+    def _render_tile(
+        self,
+        backdrop: Image.Image,
+        cells: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+        y0: int,
+        y1: int
+    ) -> Image.Image:
+        """
+        Render one horizontal tile of the final image.
+
+        Args:
+            backdrop: Enhanced photo at output size
+            cells: Arrays of (paste_x, paste_y, char_idx, font_idx) for visible cells
+            y0, y1: Vertical pixel range of the tile
 
-        # Select font (random if variation enabled)
-        font = random.choice(fonts) if len(fonts) > 1 else fonts[0]
+        Returns:
+            RGB tile of size (width, y1 - y0)
+        """
+        width = backdrop.width
+        mask = np.zeros((y1 - y0, width), dtype=np.uint8)
+        self._render_stripe(cells, mask, y0)
+
+        # Composite: show photo only through character mask
+        tile = Image.new('RGB', (width, y1 - y0), self.config.background_color)
+        tile.paste(backdrop.crop((0, y0, width, y1)), (0, 0), Image.fromarray(mask, 'L'))
+        return tile
+
+    def _save_text(self, output_path: Path, char_indices: np.ndarray):
+        """
+        Save the character grid as plain text, one line per row.
 
-        # Draw character (with bold effect if enabled)
+        Args:
+            output_path: Path to save the text file
+            char_indices: Character set index for every grid cell
+        """
+        chars = self.converter.char_lut[char_indices]
+        text = '\n'.join(''.join(row) for row in chars.tolist())
+        output_path.write_text(text + '\n', encoding='utf-8')
+
+    def _save_svg(
+        self,
+        output_path: Path,
+        backdrop: Image.Image,
+        cells: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+    ):
+        """
+        Write the art as SVG text elements filled with the embedded photo.
+
+        No mask is rasterized; the viewer renders the glyphs itself.
+
+        Args:
+            output_path: Path to save the SVG file
+            backdrop: Enhanced photo at output size
+            cells: Arrays of (paste_x, paste_y, char_idx, font_idx) for visible cells
+        """
+        width, height = backdrop.size
+
+        # Embed the photo once as a JPEG pattern shared by all characters
+        buffer = io.BytesIO()
+        backdrop.save(buffer, 'JPEG', quality=90)
+        photo = base64.b64encode(buffer.getvalue()).decode('ascii')
+
+        # One CSS class per font size; SVG y is the baseline, Pillow's is the top
+        family = self.fonts[0].getname()[0]
+        ascents = [font.getmetrics()[0] for font in self.fonts]
+        font_classes = ''.join(
+            f'.f{font_idx}{{font-size:{font.size}px}}'
+            for font_idx, font in enumerate(self.fonts)
+        )
+        text_style = f"font-family:'{escape(family)}',monospace;fill:url(#photo)"
         if self.config.bold_enabled:
-            for dx in self.config.bold_offset_range:
-                for dy in self.config.bold_offset_range:
-                    mask_draw.text((paste_x + dx, paste_y + dy), char, font=font, fill=255)
-        else:
-            mask_draw.text((paste_x, paste_y), char, font=font, fill=255)
+            pad = max(abs(offset) for offset in self.config.bold_offset_range)
+            text_style += f';font-weight:bold;stroke:url(#photo);stroke-width:{2 * pad}px'
+
+        lines = [
+            '<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+            f'width="{width}" height="{height}" viewBox="0 0 {width} {height}">',
+            '<defs>',
+            f'<pattern id="photo" patternUnits="userSpaceOnUse" width="{width}" height="{height}">',
+            f'<image width="{width}" height="{height}" '
+            f'xlink:href="data:image/jpeg;base64,{photo}"/>',
+            '</pattern>',
+            f'<style>text{{{text_style}}}{font_classes}</style>',
+            '</defs>',
+            f'<rect width="100%" height="100%" fill="{escape(self.config.background_color)}"/>',
+        ]
+
+        char_set = self.config.char_set
+        paste_xs, paste_ys, char_indices, font_indices = cells
+        for paste_x, paste_y, char_idx, font_idx in zip(
+            paste_xs.tolist(), paste_ys.tolist(), char_indices.tolist(), font_indices.tolist()
+        ):
+            lines.append(
+                f'<text class="f{font_idx}" x="{paste_x}" y="{paste_y + ascents[font_idx]}">'
+                f'{escape(char_set[char_idx])}</text>'
+            )
+        lines.append('</svg>')
+
+        output_path.write_text('\n'.join(lines), encoding='utf-8')
+
+    def _render_stripe(
+        self,
+        cells: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+        stripe: np.ndarray,
+        y0: int
+    ):
+        """
+        Render the part of the character mask covered by one stripe.
+
+        Glyph coverage is combined with np.maximum, so overlapping characters
+        merge the same way the bold dilation does.
+
+        Args:
+            cells: Arrays of (paste_x, paste_y, char_idx, font_idx) for visible cells
+            stripe: Zero-initialized mask rows to draw into
+            y0: Output row of the stripe's first line
+        """
+        paste_xs, paste_ys, char_indices, font_indices = cells
+        stripe_height, width = stripe.shape
+
+        # Include every cell whose glyph can reach into this stripe; clip the rest
+        reach_up, reach_down = self._glyph_vertical_reach
+        selected = (paste_ys + reach_down > y0) & (paste_ys + reach_up < y0 + stripe_height)
+
+        # Hot loop: bind lookups to locals and blit cached glyphs inline
+        glyph_cache = self.glyph_cache
+        maximum = np.maximum
+        for paste_x, paste_y, char_idx, font_idx in zip(
+            paste_xs[selected].tolist(),
+            (paste_ys[selected] - y0).tolist(),
+            char_indices[selected].tolist(),
+            font_indices[selected].tolist(),
+        ):
+            glyph = glyph_cache[font_idx][char_idx]
+            if glyph is None:
+                continue
+            pixels, glyph_x, glyph_y = glyph
+            x = paste_x + glyph_x
+            y = paste_y + glyph_y
+            height, glyph_width = pixels.shape
+
+            # Clip glyphs that hang over the stripe or image edges
+            if x < 0 or y < 0 or x + glyph_width > width or y + height > stripe_height:
+                left, top = max(0, -x), max(0, -y)
+                right = min(glyph_width, width - x)
+                bottom = min(height, stripe_height - y)
+                if left >= right or top >= bottom:
+                    continue
+                pixels = pixels[top:bottom, left:right]
+                x, y = x + left, y + top
+                height, glyph_width = pixels.shape
+
+            target = stripe[y:y + height, x:x + glyph_width]
+            maximum(target, pixels, out=target)
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -504,6 +957,7 @@ Examples:
   %(prog)s photo.jpg -w 40 -s 55              # Large poster characters
   %(prog)s photo.jpg --no-random              # Disable randomization for perfect grid
   %(prog)s photo.jpg -b 2.0 -c 1.5            # Extra bright and contrasty
+  %(prog)s photo.jpg --svg                    # Vector output (SVG text over the photo)
 
 Presets:
   Small detailed:  -w 120 -s 18
@@ -524,7 +978,7 @@ Presets:
     parser.add_argument(
         '-o', '--output',
         type=str,
-        help='Output image file path (default: <input>_ascii_art.png)'
+        help='Output image file path (default: <input>_ascii_art.png, or .svg with --svg)'
     )
 
     parser.add_argument(
@@ -567,6 +1021,12 @@ Presets:
         help='Disable bold effect on characters'
     )
 
+    parser.add_argument(
+        '--svg',
+        action='store_true',
+        help='Write SVG text elements filled with the photo instead of a raster image'
+    )
+
     # Character set selection
     available_sets = list(CharacterSets.get_all_sets().keys())
     parser.add_argument(
@@ -618,10 +1078,24 @@ def main():
         sys.exit(1)
 
     # Determine output path
+    suffix = ".svg" if args.svg else ".png"
     if args.output:
         output_path = Path(args.output)
+        if args.svg:
+            output_path = output_path.with_suffix(suffix)
     else:
-        output_path = input_path.parent / f"{input_path.stem}_ascii_art.png"
+        output_path = input_path.parent / f"{input_path.stem}_ascii_art{suffix}"
+
+    # Set character set (priority: --chars > --charset > default)
+    charset_kwargs = {}
+    if args.chars:
+        # Custom chars use default font (charset_name stays "ascii")
+        charset_kwargs['char_set'] = args.chars
+    elif args.charset:
+        char_sets = CharacterSets.get_all_sets()
+        charset_kwargs['char_set'] = char_sets[args.charset]
+        charset_kwargs['charset_name'] = args.charset  # Set charset name for font selection
+        print(f"Using character set: {args.charset} - {CharacterSets.get_set_description(args.charset)}")
 
     # Create configuration
     config = Config(
@@ -631,18 +1105,9 @@ def main():
         contrast_multiplier=args.contrast,
         enable_randomization=not args.no_random,
         bold_enabled=not args.no_bold,
+        **charset_kwargs,
     )
 
-    # Set character set (priority: --chars > --charset > default)
-    if args.chars:
-        config.char_set = args.chars
-        # Custom chars use default font (charset_name stays "ascii")
-    elif args.charset:
-        char_sets = CharacterSets.get_all_sets()
-        config.char_set = char_sets[args.charset]
-        config.charset_name = args.charset  # Set charset name for font selection
-        print(f"Using character set: {args.charset} - {CharacterSets.get_set_description(args.charset)}")
-
     # Generate ASCII art
     generator = ASCIIPhotoMask(config)
 
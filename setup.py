@@ -18,6 +18,7 @@ setup(
     python_requires=">=3.7",
     install_requires=[
         "Pillow>=10.0.0",
+        "numpy>=1.21.0",
         "gradio>=5.0.0",
         "python-dotenv>=1.0.0",
     ],
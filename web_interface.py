@@ -4,12 +4,185 @@ ASCII Photo Mask - Web Interface
 Professional landing page for ASCII art generation.
 """
 
-import gradio as gr
+from __future__ import annotations
+
 import tempfile
 import os
-import base64
+import re
+import functools
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from ascii_art import ASCIIPhotoMask, Config, CharacterSets
+from typing import Optional, Tuple
+
+# Keep results and Gradio's file cache in RAM (tmpfs) where available;
+# SERVER_TMPDIR overrides. Results and PNG exports are written inside the
+# cache, so Gradio serves them without hashing and copying them first. Only
+# computed here; _lazy() exports it before gradio is imported.
+_scratch_dir = os.getenv("SERVER_TMPDIR") or (
+    '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+)
+OUTPUT_DIR = os.getenv("GRADIO_TEMP_DIR") or os.path.join(_scratch_dir, "ascii_photo_mask")
+
+# Heavy dependencies, bound by _lazy() on first use so the handlers can be
+# imported (e.g. by dev tooling) without loading Gradio, Pillow and NumPy
+gr = None
+Image = None
+ASCIIPhotoMask = Config = CharacterSets = None
+
+
+def _lazy():
+    """Import gradio, Pillow and the generator into module globals."""
+    global gr, Image, ASCIIPhotoMask, Config, CharacterSets
+    os.environ.setdefault("GRADIO_TEMP_DIR", OUTPUT_DIR)
+    import gradio as gr
+    from PIL import Image
+    from ascii_art import ASCIIPhotoMask, Config, CharacterSets
+
+
+OUTPUT_MAX_AGE = 10 * 60  # Seconds before a result file is deleted
+CLEANUP_INTERVAL = 60  # Seconds between cleanup sweeps
+
+# Tile rendering pool shared by every generator, so requests don't pay for
+# thread startup
+_render_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix='ascii_render'
+)
+
+
+def _build_config(
+    char_width: int,
+    font_size: int,
+    brightness: float,
+    contrast: float,
+    randomize: bool,
+    bold: bool,
+    charset: str
+) -> Config:
+    """Build the generation config for one request's UI settings."""
+    _lazy()
+
+    # Get character set
+    char_sets = CharacterSets.get_all_sets()
+    char_set = char_sets.get(charset, CharacterSets.ASCII_STANDARD)
+
+    return Config(
+        char_width=char_width,
+        font_size=font_size,
+        brightness_multiplier=brightness,
+        contrast_multiplier=contrast,
+        enable_randomization=randomize,
+        bold_enabled=bold,
+        char_set=char_set,
+        charset_name=charset,  # Set charset name for font selection
+    )
+
+
+# Quick preset (char_width, font_size) pairs offered by the UI
+PRESETS = {
+    "Detailed": (120, 18),
+    "Medium": (60, 30),
+    "Bold": (40, 55),
+}
+
+# Pre-rasterized glyphs for the presets, keyed by _glyph_key(config)
+_GLYPH_CACHE = {}
+
+
+def _glyph_key(cfg: Config) -> tuple:
+    """Return the Config fields that determine the rasterized glyphs."""
+    return (cfg.char_set, cfg.charset_name, cfg.font_size,
+            cfg.enable_randomization, cfg.bold_enabled)
+
+
+def _precompute_preset_glyphs():
+    """Rasterize the glyphs for every preset with and without bold."""
+    for char_width, font_size in PRESETS.values():
+        for bold in (True, False):
+            cfg = _build_config(char_width, font_size, 1.8, 1.3, True, bold, 'ascii')
+            _GLYPH_CACHE[_glyph_key(cfg)] = ASCIIPhotoMask(cfg).glyph_cache
+
+
+@functools.lru_cache(maxsize=32)
+def _get_generator(cfg: Config) -> ASCIIPhotoMask:
+    """
+    Build (or reuse) the generator for one configuration.
+
+    The generator holds its fonts and pre-rendered glyph atlases, so requests
+    with an equal Config skip font loading and glyph rasterization. Configs
+    matching a preset also reuse its glyphs when only brightness, contrast or
+    width differ.
+    """
+    return ASCIIPhotoMask(cfg, _GLYPH_CACHE.get(_glyph_key(cfg)), executor=_render_pool)
+
+
+# Recent (result image, display JPEG path) pairs by _result_key, least recent first
+RESULT_CACHE_SIZE = 16
+RESULT_CACHE_MAX_BYTES = 256 * 1024 * 1024  # Total decoded pixel bytes held
+_RESULT_CACHE: "OrderedDict[bytes, Tuple[Image.Image, str]]" = OrderedDict()
+_result_cache_bytes = 0
+_result_lock = threading.Lock()
+
+
+def _result_key(image: Image.Image, cfg: Config) -> bytes:
+    """Hash the working image pixels together with the full configuration."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{image.mode}{image.size}{cfg!r}".encode())
+    digest.update(image.tobytes())
+    return digest.digest()
+
+
+def _cache_result(key: bytes, result: Image.Image, jpeg_path: str):
+    """
+    Remember a result, evicting the oldest entries past the count or byte limit.
+
+    Results larger than RESULT_CACHE_MAX_BYTES on their own are not cached.
+    """
+    global _result_cache_bytes
+    size = result.width * result.height * len(result.getbands())
+    if size > RESULT_CACHE_MAX_BYTES:
+        return
+
+    with _result_lock:
+        if key in _RESULT_CACHE:
+            return
+        _RESULT_CACHE[key] = (result, jpeg_path)
+        _result_cache_bytes += size
+        while (len(_RESULT_CACHE) > RESULT_CACHE_SIZE
+               or _result_cache_bytes > RESULT_CACHE_MAX_BYTES):
+            evicted, _ = _RESULT_CACHE.popitem(last=False)[1]
+            _result_cache_bytes -= evicted.width * evicted.height * len(evicted.getbands())
+
+
+def _new_output_path(suffix: str) -> Path:
+    """Reserve a fresh result file in OUTPUT_DIR (removed by _cleanup_outputs)."""
+    os.makedirs(OUTPUT_DIR, exist_ok=True)  # For callers that skip build_demo()
+    output_file = tempfile.NamedTemporaryFile(
+        delete=False,
+        suffix=suffix,
+        prefix='ascii_art_',
+        dir=OUTPUT_DIR
+    )
+    output_file.close()
+    return Path(output_file.name)
+
+
+def _encode_jpeg(image: Image.Image) -> str:
+    """
+    Encode a rendered image as a quality-92 JPEG for display.
+
+    Args:
+        image: Rendered ASCII art
+
+    Returns:
+        Path to the JPEG, inside Gradio's cache so it is served as-is
+    """
+    output_path = _new_output_path('.jpg')
+    image.save(output_path, 'JPEG', quality=92, optimize=False)
+    return str(output_path)
 
 
 def generate_ascii_art(
@@ -20,13 +193,18 @@ def generate_ascii_art(
     contrast: float,
     randomize: bool,
     bold: bool,
-    charset: str
+    charset: str,
+    progress=None
 ):
     """
     Generate ASCII photo mask from uploaded image.
 
+    Yields a quick low-resolution preview first, then the full result, so the
+    output updates before the full render finishes. Repeating an image and
+    settings seen recently yields the cached result straight away.
+
     Args:
-        image: Uploaded image from Gradio
+        image: Uploaded image from Gradio, already decoded
         char_width: Number of characters across width
         font_size: Size of each character in pixels
         brightness: Brightness multiplier
@@ -34,57 +212,116 @@ def generate_ascii_art(
         randomize: Enable randomization for organic look
         bold: Enable bold characters
         charset: Character set name (e.g., 'ascii', 'blocks', 'emoji_faces')
+        progress: Optional progress callback (gr.Progress in the web UI)
 
-    Returns:
-        Path to generated ASCII art image
+    Yields:
+        (preview JPEG path, None), then (final JPEG path, final image); the
+        image is kept in session state for the lossless PNG export
 
     Note:
-        Gradio automatically handles cleanup of uploaded files and returned files.
-        Temporary files are stored in Gradio's cache and cleaned up periodically.
+        Results are shown as quality-92 JPEGs (Gradio's own PIL encode would
+        drop to quality 75). They and the PNG exports go to OUTPUT_DIR, inside
+        Gradio's cache, and are deleted after OUTPUT_MAX_AGE by _cleanup_outputs.
     """
     if image is None:
-        return None
+        yield None, None
+        return
+
+    _lazy()
+    if progress is None:
+        progress = lambda *args, **kwargs: None  # noqa: E731
 
     try:
-        # Get character set
-        char_sets = CharacterSets.get_all_sets()
-        char_set = char_sets.get(charset, CharacterSets.ASCII_STANDARD)
-
-        # Create configuration
-        config = Config(
-            char_width=char_width,
-            font_size=font_size,
-            brightness_multiplier=brightness,
-            contrast_multiplier=contrast,
-            enable_randomization=randomize,
-            bold_enabled=bold,
-            char_set=char_set,
-            charset_name=charset,  # Set charset name for font selection
-        )
+        char_width, font_size = int(char_width), int(font_size)
+        style = (brightness, contrast, randomize, bold, charset)
+
+        # Bound the working resolution to twice the output size; every later
+        # stage downsamples further, so BILINEAR is enough here. Work on a
+        # copy so the caller's image is left untouched.
+        target_width = char_width * font_size
+        target_height = int(target_width * image.height / image.width)
+        bound = (target_width * 2, target_height * 2)
+        if image.width > bound[0] or image.height > bound[1]:
+            image = image.copy()
+            image.thumbnail(bound, Image.Resampling.BILINEAR)
+
+        # Repeat submissions of the same image and settings reuse the result
+        config = _build_config(char_width, font_size, *style)
+        key = _result_key(image, config)
+        with _result_lock:
+            cached = _RESULT_CACHE.get(key)
+            if cached is not None:
+                _RESULT_CACHE.move_to_end(key)
+        if cached is not None:
+            result, jpeg_path = cached
+            if not os.path.exists(jpeg_path):
+                jpeg_path = _encode_jpeg(result)  # Swept by _cleanup_outputs
+            yield jpeg_path, result
+            return
+
+        # Coarse pass: fewer, smaller characters render in a fraction of the time
+        progress(0.0, desc="Rendering preview...")
+        preview_config = _build_config(max(20, char_width // 3), max(1, font_size // 2), *style)
+        yield _encode_jpeg(_get_generator(preview_config).generate(image)), None
+
+        # Full-resolution pass
+        progress(0.5, desc="Rendering full resolution...")
+        result = _get_generator(config).generate(image)
+        jpeg_path = _encode_jpeg(result)
+        _cache_result(key, result, jpeg_path)
+        yield jpeg_path, result
 
-        # Create generator
-        generator = ASCIIPhotoMask(config)
+    except Exception as e:
+        print(f"Error generating ASCII art: {e}")
+        yield None, None
 
-        # Create temporary output file (Gradio will handle cleanup)
-        output_file = tempfile.NamedTemporaryFile(
-            delete=False,
-            suffix='.png',
-            prefix='ascii_art_',
-            dir=tempfile.gettempdir()
-        )
-        output_path = Path(output_file.name)
-        output_file.close()
 
-        # Generate ASCII art
-        input_path = Path(image)
-        generator.generate(input_path, output_path)
+def export_png(result: Optional[Image.Image]) -> Optional[str]:
+    """
+    Encode the last full-resolution result as a lossless PNG on demand.
 
-        return str(output_path)
+    Args:
+        result: Rendered image kept from the latest generate call
 
-    except Exception as e:
-        print(f"Error generating ASCII art: {e}")
+    Returns:
+        Path to the PNG file, or None if nothing has been generated yet
+    """
+    if result is None:
         return None
 
+    output_path = _new_output_path('.png')
+    result.save(output_path, 'PNG', optimize=False)
+    return str(output_path)
+
+
+def _cleanup_outputs():
+    """Delete result files older than OUTPUT_MAX_AGE, then reschedule itself."""
+    cutoff = time.time() - OUTPUT_MAX_AGE
+    for path in Path(OUTPUT_DIR).glob('ascii_art_*'):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass  # Already removed or still being written
+
+    timer = threading.Timer(CLEANUP_INTERVAL, _cleanup_outputs)
+    timer.daemon = True
+    timer.start()
+
+
+def _warm_up():
+    """
+    Render a tiny sentinel image with the default UI settings.
+
+    Loads fonts, builds the glyph atlases for the preview and full-size
+    generators and touches every render code path once, so the first real
+    request doesn't pay for it.
+    """
+    _lazy()
+    sentinel = Image.new('RGB', (64, 64), 'gray')
+    for _ in generate_ascii_art(sentinel, 80, 25, 1.8, 1.3, True, True, 'ascii'):
+        pass
+
 
 # Professional Landing Page CSS
 custom_css = """
@@ -478,50 +715,35 @@ footer {
 }
 """
 
-# Get paths to example images and convert to base64
-examples_dir = Path(__file__).parent / "examples"
+# Minify once at import (comments, whitespace); DEBUG_CSS keeps it readable
+if not os.getenv("DEBUG_CSS"):
+    custom_css = re.sub(r'/\*.*?\*/', '', custom_css, flags=re.S)
+    custom_css = re.sub(r'\s+', ' ', custom_css)
+    custom_css = re.sub(r'\s*([{};])\s*', r'\1', custom_css).strip()
+
+# Serve the example images as static files so browsers can cache them
+examples_dir = Path(__file__).resolve().parent / "examples"
 before_img_path = examples_dir / "before.jpeg"
 after_img_path = examples_dir / "after.png"
 
-def image_to_base64(image_path: Path) -> str:
-    """Convert image file to base64 data URL."""
-    with open(image_path, 'rb') as f:
-        image_data = base64.b64encode(f.read()).decode('utf-8')
-
-    # Determine MIME type
-    suffix = image_path.suffix.lower()
-    mime_type = 'image/jpeg' if suffix in ['.jpg', '.jpeg'] else f'image/{suffix[1:]}'
-
-    return f"data:{mime_type};base64,{image_data}"
-
-# Convert images to base64
-before_img = image_to_base64(before_img_path)
-after_img = image_to_base64(after_img_path)
-
-# Create Gradio interface
-theme = gr.themes.Soft(
-    primary_hue="blue",
-    secondary_hue="slate",
-    neutral_hue="slate",
-).set(
-    body_background_fill="#000000",
-    button_primary_background_fill="#3b82f6",
-)
+# Gradio 5+ serves static files under /gradio_api/file=
+before_img = f"/gradio_api/file={before_img_path}"
+after_img = f"/gradio_api/file={after_img_path}"
 
-with gr.Blocks(title="ASCII Photo Mask - Transform Photos into Art", theme=theme, css=custom_css) as demo:
+# Static page sections, built once at import
 
-    # Hero Section
-    gr.HTML("""
+# Hero Section
+HERO_HTML = """
         <div class="hero">
             <h1>ASCII Photo Mask</h1>
             <p class="subtitle">
                 Transform your photos into visual art where the image shines through character-shaped masks.
             </p>
         </div>
-    """)
+    """
 
-    # How it Works
-    gr.HTML("""
+# How it Works
+STEPS_HTML = """
         <div class="steps">
             <div class="step">
                 <div class="step-number">1</div>
@@ -539,10 +761,10 @@ with gr.Blocks(title="ASCII Photo Mask - Transform Photos into Art", theme=theme
                 <p>Get your high-resolution ASCII art ready for printing or sharing</p>
             </div>
         </div>
-    """)
+    """
 
-    # Interactive Before/After Slider
-    gr.HTML("""
+# Before/after comparison block, rendered once at import
+EXAMPLE_SECTION_HTML = f"""
         <div class="example-section">
             <h2>See It In Action</h2>
             <p class="example-subtitle">Drag the slider to compare original photo with ASCII art result</p>
@@ -562,170 +784,254 @@ with gr.Blocks(title="ASCII Photo Mask - Transform Photos into Art", theme=theme
                        oninput="this.parentElement.style.setProperty('--slider-pos', this.value + '%')" />
             </div>
         </div>
-    """.format(before_img=before_img, after_img=after_img))
-
-    # Main Section
-    with gr.Row():
-        # Left Column - Upload & Settings
-        with gr.Column(scale=1):
-            image_input = gr.Image(
-                type="filepath",
-                label="Upload Photo",
-                sources=["upload", "clipboard"],
-                elem_classes=["image-preview"]
-            )
-
-            # Quick Presets
-            gr.Markdown("### Quick Presets")
-            with gr.Row():
-                preset_detailed = gr.Button("Detailed", size="sm", variant="secondary")
-                preset_medium = gr.Button("Medium", size="sm", variant="secondary")
-                preset_bold = gr.Button("Bold", size="sm", variant="secondary")
-
-            # Character Style Selection
-            gr.Markdown("### Character Style")
-            charset_choices = [(CharacterSets.get_set_description(name), name)
-                             for name in sorted(CharacterSets.get_all_sets().keys())]
-            charset = gr.Dropdown(
-                choices=charset_choices,
-                value="ascii",
-                label="Character Set",
-                info="Choose the characters used to create the art"
-            )
-
-            # Settings
-            with gr.Accordion("Advanced Settings", open=False):
-                char_width = gr.Slider(
-                    minimum=20,
-                    maximum=200,
-                    value=80,
-                    step=10,
-                    label="Character Density",
-                    info="More characters = finer detail"
-                )
+    """
 
-                font_size = gr.Slider(
-                    minimum=8,
-                    maximum=60,
-                    value=25,
-                    step=1,
-                    label="Character Size",
-                    info="Size of each character in pixels"
-                )
+# Technical Info Footer
+FOOTER_HTML = """
+        <div class="footer">
+            <p><strong>Algorithm</strong> — Brightness-based character mapping with PIL composite masking</p>
+            <p><strong>Privacy</strong> — Files processed server-side, automatically cleaned up periodically</p>
+            <p><strong>License</strong> — MIT Open Source</p>
+        </div>
+    """
 
-                brightness = gr.Slider(
-                    minimum=1.0,
-                    maximum=3.0,
-                    value=1.8,
-                    step=0.1,
-                    label="Brightness",
-                    info="Lighter = more visible through characters"
-                )
+# Creator Footer
+CREATOR_FOOTER_HTML = """
+        <div class="creator-footer">
+            <p>Created by <span class="creator-name">0x0ndra</span></p>
+            <div class="creator-links">
+                <a href="https://ondra-vlasek.cz" target="_blank">Website</a>
+                <a href="https://github.com/0x0ndra" target="_blank">GitHub</a>
+                <a href="https://github.com/0x0ndra/ascii-photo-mask" target="_blank">Source Code</a>
+                <a href="https://github.com/0x0ndra/ascii-photo-mask/issues" target="_blank">Report Issues</a>
+                <a href="https://btcpay.rpipay.org/api/v1/invoices?storeId=BwZszjZ5ieW6apLWoKwuh72fkBQjGNN9BjTZmFfB3eH7&currency=USD" target="_blank">Donate</a>
+            </div>
+        </div>
+    """
+
+
+def build_demo():
+    """
+    Build the Gradio interface.
+
+    Returns:
+        The assembled gr.Blocks app (not yet queued or launched)
+    """
+    _lazy()
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    gr.set_static_paths([str(examples_dir)])
+
+    # Gradio injects a progress tracker into parameters defaulting to gr.Progress
+    def generate_with_progress(image, char_width, font_size, brightness, contrast,
+                               randomize, bold, charset, progress=gr.Progress()):
+        yield from generate_ascii_art(image, char_width, font_size, brightness, contrast,
+                                      randomize, bold, charset, progress=progress)
+
+    theme = gr.themes.Soft(
+        primary_hue="blue",
+        secondary_hue="slate",
+        neutral_hue="slate",
+    ).set(
+        body_background_fill="#000000",
+        button_primary_background_fill="#3b82f6",
+    )
 
-                contrast = gr.Slider(
-                    minimum=1.0,
-                    maximum=2.0,
-                    value=1.3,
-                    step=0.1,
-                    label="Contrast",
-                    info="Higher = more dramatic effect"
+    with gr.Blocks(
+        title="ASCII Photo Mask - Transform Photos into Art",
+        theme=theme,
+        css=custom_css,
+        delete_cache=(CLEANUP_INTERVAL, OUTPUT_MAX_AGE),  # Bound the RAM-backed cache
+    ) as demo:
+
+        # Hero Section
+        gr.HTML(HERO_HTML)
+
+        # How it Works
+        gr.HTML(STEPS_HTML)
+
+        # Interactive Before/After Slider
+        gr.HTML(EXAMPLE_SECTION_HTML)
+
+        # Main Section
+        with gr.Row():
+            # Left Column - Upload & Settings
+            with gr.Column(scale=1):
+                image_input = gr.Image(
+                    type="pil",
+                    label="Upload Photo",
+                    sources=["upload", "clipboard"],
+                    elem_classes=["image-preview"]
                 )
 
-                randomize = gr.Checkbox(
-                    value=True,
-                    label="Organic Look",
-                    info="Slightly vary character positions for hand-crafted feel"
+                # Quick Presets
+                gr.Markdown("### Quick Presets")
+                with gr.Row():
+                    preset_detailed = gr.Button("Detailed", size="sm", variant="secondary")
+                    preset_medium = gr.Button("Medium", size="sm", variant="secondary")
+                    preset_bold = gr.Button("Bold", size="sm", variant="secondary")
+
+                # Character Style Selection
+                gr.Markdown("### Character Style")
+                charset_choices = [(CharacterSets.get_set_description(name), name)
+                                 for name in sorted(CharacterSets.get_all_sets().keys())]
+                charset = gr.Dropdown(
+                    choices=charset_choices,
+                    value="ascii",
+                    label="Character Set",
+                    info="Choose the characters used to create the art"
                 )
 
-                bold = gr.Checkbox(
-                    value=True,
-                    label="Bold Characters",
-                    info="Thicker characters for better visibility"
+                # Settings
+                with gr.Accordion("Advanced Settings", open=False):
+                    char_width = gr.Slider(
+                        minimum=20,
+                        maximum=200,
+                        value=80,
+                        step=10,
+                        label="Character Density",
+                        info="More characters = finer detail"
+                    )
+
+                    font_size = gr.Slider(
+                        minimum=8,
+                        maximum=60,
+                        value=25,
+                        step=1,
+                        label="Character Size",
+                        info="Size of each character in pixels"
+                    )
+
+                    brightness = gr.Slider(
+                        minimum=1.0,
+                        maximum=3.0,
+                        value=1.8,
+                        step=0.1,
+                        label="Brightness",
+                        info="Lighter = more visible through characters"
+                    )
+
+                    contrast = gr.Slider(
+                        minimum=1.0,
+                        maximum=2.0,
+                        value=1.3,
+                        step=0.1,
+                        label="Contrast",
+                        info="Higher = more dramatic effect"
+                    )
+
+                    randomize = gr.Checkbox(
+                        value=True,
+                        label="Organic Look",
+                        info="Slightly vary character positions for hand-crafted feel"
+                    )
+
+                    bold = gr.Checkbox(
+                        value=True,
+                        label="Bold Characters",
+                        info="Thicker characters for better visibility"
+                    )
+
+                # Generate Button
+                generate_btn = gr.Button("Generate ASCII Art", variant="primary", size="lg")
+
+            # Right Column - Result
+            with gr.Column(scale=1):
+                image_output = gr.Image(
+                    label="Result",
+                    type="filepath",
+                    elem_classes=["image-preview"]
                 )
 
-            # Generate Button
-            generate_btn = gr.Button("Generate ASCII Art", variant="primary", size="lg")
+                # Lossless download, encoded only when requested
+                result_state = gr.State(None)
+                download_png_btn = gr.Button("Download PNG", variant="secondary")
+                png_file = gr.File(label="PNG Download")
 
-        # Right Column - Result
-        with gr.Column(scale=1):
-            image_output = gr.Image(
-                label="Result",
-                type="filepath",
-                elem_classes=["image-preview"]
-            )
 
+                # Tips
+                gr.Markdown("""
+                    ### Tips for Best Results
 
-            # Tips
-            gr.Markdown("""
-                ### Tips for Best Results
+                    **Detailed** — Many small characters (120 density) for fine detail
 
-                **Detailed** — Many small characters (120 density) for fine detail
+                    **Medium** — Balanced look (60 density) works for most photos
 
-                **Medium** — Balanced look (60 density) works for most photos
+                    **Bold** — Large characters (40 density) for striking, poster-like results
 
-                **Bold** — Large characters (40 density) for striking, poster-like results
+                    **Dark Photos** — Increase brightness to 2.0+ for better visibility
+                """)
 
-                **Dark Photos** — Increase brightness to 2.0+ for better visibility
-            """)
+        # Preset Handlers
+        preset_detailed.click(
+            fn=lambda: PRESETS["Detailed"],
+            outputs=[char_width, font_size]
+        )
 
-    # Preset Handlers
-    preset_detailed.click(
-        fn=lambda: (120, 18),
-        outputs=[char_width, font_size]
-    )
+        preset_medium.click(
+            fn=lambda: PRESETS["Medium"],
+            outputs=[char_width, font_size]
+        )
 
-    preset_medium.click(
-        fn=lambda: (60, 30),
-        outputs=[char_width, font_size]
-    )
+        preset_bold.click(
+            fn=lambda: PRESETS["Bold"],
+            outputs=[char_width, font_size]
+        )
 
-    preset_bold.click(
-        fn=lambda: (40, 55),
-        outputs=[char_width, font_size]
-    )
+        # Generate Handler
+        generate_btn.click(
+            fn=generate_with_progress,
+            api_name="generate_ascii_art",
+            inputs=[
+                image_input,
+                char_width,
+                font_size,
+                brightness,
+                contrast,
+                randomize,
+                bold,
+                charset
+            ],
+            outputs=[image_output, result_state]
+        )
 
-    # Generate Handler
-    generate_btn.click(
-        fn=generate_ascii_art,
-        inputs=[
-            image_input,
-            char_width,
-            font_size,
-            brightness,
-            contrast,
-            randomize,
-            bold,
-            charset
-        ],
-        outputs=image_output
-    )
+        # PNG Export Handler
+        download_png_btn.click(
+            fn=export_png,
+            inputs=result_state,
+            outputs=png_file
+        )
 
-    # Technical Info Footer
-    gr.HTML("""
-        <div class="footer">
-            <p><strong>Algorithm</strong> — Brightness-based character mapping with PIL composite masking</p>
-            <p><strong>Privacy</strong> — Files processed server-side, automatically cleaned up periodically</p>
-            <p><strong>License</strong> — MIT Open Source</p>
-        </div>
-    """)
+        # Technical Info Footer
+        gr.HTML(FOOTER_HTML)
 
-    # Creator Footer
-    gr.HTML("""
-        <div class="creator-footer">
-            <p>Created by <span class="creator-name">0x0ndra</span></p>
-            <div class="creator-links">
-                <a href="https://ondra-vlasek.cz" target="_blank">Website</a>
-                <a href="https://github.com/0x0ndra" target="_blank">GitHub</a>
-                <a href="https://github.com/0x0ndra/ascii-photo-mask" target="_blank">Source Code</a>
-                <a href="https://github.com/0x0ndra/ascii-photo-mask/issues" target="_blank">Report Issues</a>
-                <a href="https://btcpay.rpipay.org/api/v1/invoices?storeId=BwZszjZ5ieW6apLWoKwuh72fkBQjGNN9BjTZmFfB3eH7&currency=USD" target="_blank">Donate</a>
-            </div>
-        </div>
-    """)
+        # Creator Footer
+        gr.HTML(CREATOR_FOOTER_HTML)
+
+    return demo
+
+
+# Build the UI at import only for serving (ASCII_SERVE=1, e.g. `gradio web_interface.py`)
+demo = build_demo() if os.getenv("ASCII_SERVE") == "1" else None
 
 
 if __name__ == "__main__":
     import os
+    import PIL
+
+    if demo is None:
+        demo = build_demo()
+
+    # Pillow-SIMD builds carry a ".post" version suffix
+    simd = ".post" in PIL.__version__
+    print(f"Pillow {PIL.__version__} ({'SIMD' if simd else 'stock'} build)")
+
+    # Build the preset glyphs and default generators before accepting requests
+    _precompute_preset_glyphs()
+    _warm_up()
+    _cleanup_outputs()
+
+    # Queue requests and render up to one per core in parallel
+    demo.queue(default_concurrency_limit=os.cpu_count(), max_size=32)
     demo.launch(
         share=False,
         server_name=os.getenv("SERVER_HOST", "0.0.0.0"),